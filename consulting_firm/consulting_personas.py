@@ -6,8 +6,10 @@ This module provides an elite consulting firm experience where:
 - Team composition adapts to project type
 - Conversation feels like working with human consultants
 """
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional
 from enum import Enum
+from types import MappingProxyType
 
 
 class ProjectDomain(Enum):
@@ -715,24 +717,25 @@ def detect_project_domain(user_input: str, documents_context: str = "") -> Proje
     return ProjectDomain.GENERAL
 
 
-def get_specialists_for_domain(domain: ProjectDomain) -> List[Dict[str, str]]:
+# Read-only specialist profiles, built once per persona and shared by every team
+_SPECIALIST_PROFILES: Dict[str, Mapping[str, str]] = {
+    key: MappingProxyType({
+        "key": key,
+        "name": persona["name"],
+        "title": persona["title"],
+        "expertise": persona["expertise"]
+    })
+    for key, persona in CONSULTING_PERSONAS.items()
+}
+
+
+def get_specialists_for_domain(domain: ProjectDomain) -> List[Mapping[str, str]]:
     """Get the specialist team for a given project domain.
     
-    Returns a list of specialist profiles with name, title, and expertise.
+    Returns a list of read-only specialist profiles with key, name, title, and expertise.
     """
     specialist_keys = DOMAIN_SPECIALISTS.get(domain, DOMAIN_SPECIALISTS[ProjectDomain.GENERAL])
-    specialists = []
-    
-    for key in specialist_keys:
-        persona = CONSULTING_PERSONAS[key]
-        specialists.append({
-            "key": key,
-            "name": persona["name"],
-            "title": persona["title"],
-            "expertise": persona["expertise"]
-        })
-    
-    return specialists
+    return [_SPECIALIST_PROFILES[key] for key in specialist_keys]
 
 
 def get_persona_prompt(persona_key: str) -> str:
@@ -743,10 +746,12 @@ def get_persona_prompt(persona_key: str) -> str:
     return persona["prompt"]
 
 
+@lru_cache(maxsize=None)
 def format_team_introduction(domain: ProjectDomain) -> str:
     """Generate a professional team introduction for the client.
     
-    This is shown at the start of the consultation.
+    This is shown at the start of the consultation. The text depends only on
+    the domain, so each one is built on first use and then reused.
     """
     specialists = get_specialists_for_domain(domain)
     
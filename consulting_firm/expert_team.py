@@ -32,6 +32,8 @@ class ExpertTeam:
         self.model = ModelClient(model_provider)
         self.coordinator = AgentCoordinator(self.model, log_callback=log_callback)
         self.log_callback = log_callback or (lambda msg: None)
+        # (docs signature, context) from the last _gather_project_context call
+        self._docs_context_cache: tuple | None = None
         
     def _log(self, message: str):
         """Send progress message to callback"""
@@ -42,14 +44,38 @@ class ExpertTeam:
         with open(path, "w", encoding="utf-8") as f:
             f.write(text)
 
+    @staticmethod
+    def _docs_signature(docs_dir: str) -> tuple:
+        """(path, size, mtime_ns) for every file under docs_dir, in a stable order."""
+        entries = []
+        for root, _, files in os.walk(docs_dir):
+            for fn in files:
+                fp = os.path.join(root, fn)
+                try:
+                    st = os.stat(fp)
+                except OSError:
+                    continue
+                entries.append((fp, st.st_size, st.st_mtime_ns))
+        return tuple(sorted(entries))
+
     def _gather_project_context(self, project_path: str) -> str:
         """Read any files under project_documents/ and build a brief context block.
 
         Includes up to ~8000 characters combined to avoid blowing past token limits.
+        The result is reused across refinement rounds until a document is added,
+        removed or modified.
         """
         docs_dir = os.path.join(project_path, "project_documents")
         if not os.path.isdir(docs_dir):
             return "(No prior documents provided.)"
+        signature = self._docs_signature(docs_dir)
+        if self._docs_context_cache and self._docs_context_cache[0] == signature:
+            return self._docs_context_cache[1]
+        context = self._read_project_documents(project_path, docs_dir)
+        self._docs_context_cache = (signature, context)
+        return context
+
+    def _read_project_documents(self, project_path: str, docs_dir: str) -> str:
         parts = []
         total = 0
         for root, _, files in os.walk(docs_dir):
@@ -173,9 +199,9 @@ class ExpertTeam:
     
     def _synthesize_discovery(self, outputs: Dict[str, str]) -> str:
         """Synthesize discovery outputs from multiple agents into coherent report."""
-        report = "# Project Discovery Report\n\n"
-        report += "*This report was collaboratively generated through multi-agent coordination with peer review*\n\n"
-        report += "---\n\n"
+        report = ["# Project Discovery Report\n\n"]
+        report.append("*This report was collaboratively generated through multi-agent coordination with peer review*\n\n")
+        report.append("---\n\n")
         
         # Map task outputs to sections
         section_mapping = {
@@ -192,8 +218,8 @@ class ExpertTeam:
         
         # Add synthesis first (executive summary)
         if "discovery_synthesis" in outputs:
-            report += section_mapping["discovery_synthesis"]
-            report += outputs["discovery_synthesis"] + "\n\n"
+            report.append(section_mapping["discovery_synthesis"])
+            report.append(outputs["discovery_synthesis"] + "\n\n")
         
         # Add other sections in logical order
         section_order = [
@@ -203,16 +229,16 @@ class ExpertTeam:
         
         for task_id in section_order:
             if task_id in outputs and task_id != "discovery_synthesis":
-                report += section_mapping.get(task_id, f"## {task_id}\n")
-                report += outputs[task_id] + "\n\n"
+                report.append(section_mapping.get(task_id, f"## {task_id}\n"))
+                report.append(outputs[task_id] + "\n\n")
         
-        return report
+        return "".join(report)
     
     def _synthesize_sow(self, outputs: Dict[str, str]) -> str:
         """Synthesize SOW outputs from multiple agents into coherent document."""
-        sow = "# Scope of Work\n\n"
-        sow += "*This SOW was collaboratively generated through multi-agent coordination with quality assurance review*\n\n"
-        sow += "---\n\n"
+        sow = ["# Scope of Work\n\n"]
+        sow.append("*This SOW was collaboratively generated through multi-agent coordination with quality assurance review*\n\n")
+        sow.append("---\n\n")
         
         section_mapping = {
             "sow_executive_summary": "## EXECUTIVE SUMMARY\n",
@@ -225,8 +251,8 @@ class ExpertTeam:
         
         # Start with final synthesis if available
         if "sow_final_synthesis" in outputs:
-            sow += section_mapping["sow_final_synthesis"]
-            sow += outputs["sow_final_synthesis"] + "\n\n"
+            sow.append(section_mapping["sow_final_synthesis"])
+            sow.append(outputs["sow_final_synthesis"] + "\n\n")
         
         # Add sections in logical order
         section_order = [
@@ -236,10 +262,10 @@ class ExpertTeam:
         
         for task_id in section_order:
             if task_id in outputs:
-                sow += section_mapping.get(task_id, f"## {task_id}\n")
-                sow += outputs[task_id] + "\n\n"
+                sow.append(section_mapping.get(task_id, f"## {task_id}\n"))
+                sow.append(outputs[task_id] + "\n\n")
         
-        return sow
+        return "".join(sow)
     
     def _generate_technical_architecture(self, context: Dict, sow_text: str) -> str:
         """Generate technical architecture section."""
@@ -42,6 +42,12 @@ class ClientProfile:
         if self.inferred_project_info is None:
             self.inferred_project_info = {}
     
+    def __setattr__(self, name, value):
+        # Any field assignment invalidates the cached context string
+        object.__setattr__(self, name, value)
+        if name != '_context_cache':
+            self.__dict__.pop('_context_cache', None)
+    
     def is_complete(self) -> bool:
         """Check if minimum required information is collected."""
         return bool(
@@ -51,16 +57,45 @@ class ClientProfile:
         )
     
     def to_context_string(self) -> str:
-        """Format profile as context for AI agents."""
-        parts = [
-            f"Client: {self.client_name}",
-            f"Organization: {self.organization}" if self.organization else "",
-            f"Project: {self.project_name}",
-            f"Industry: {self.industry}" if self.industry else "",
-            f"Description: {self.project_description}",
-            f"Objectives: {self.primary_objectives}" if self.primary_objectives else "",
-        ]
-        return "\n".join(p for p in parts if p)
+        """Format profile as context for AI agents.
+
+        The result is cached until a field is reassigned.
+        """
+        cached = self.__dict__.get('_context_cache')
+        if cached is None:
+            parts = [
+                f"Client: {self.client_name}",
+                f"Organization: {self.organization}" if self.organization else "",
+                f"Project: {self.project_name}",
+                f"Industry: {self.industry}" if self.industry else "",
+                f"Description: {self.project_description}",
+                f"Objectives: {self.primary_objectives}" if self.primary_objectives else "",
+            ]
+            cached = self._context_cache = "\n".join(p for p in parts if p)
+        return cached
+
+
+def _validate_client_info(profile: ClientProfile) -> tuple[bool, str]:
+    if not profile.client_name:
+        return False, "Please provide your name"
+    return True, ""
+
+
+def _validate_project_overview(profile: ClientProfile) -> tuple[bool, str]:
+    if not profile.project_name:
+        return False, "Please provide a project name"
+    if not profile.project_description:
+        return False, "Please provide a project description"
+    return True, ""
+
+
+# Stage dispatch tables, built once at import
+_STAGE_VALIDATORS = {
+    IntakeStage.CLIENT_INFO: _validate_client_info,
+    IntakeStage.PROJECT_OVERVIEW: _validate_project_overview,
+}
+_STAGE_ORDER = tuple(IntakeStage)
+_NEXT_STAGE = dict(zip(_STAGE_ORDER, _STAGE_ORDER[1:]))
 
 
 class IntakeWorkflow:
@@ -101,35 +136,14 @@ class IntakeWorkflow:
     @staticmethod
     def validate_stage_completion(stage: IntakeStage, profile: ClientProfile) -> tuple[bool, str]:
         """Validate if current stage requirements are met."""
-        if stage == IntakeStage.CLIENT_INFO:
-            if not profile.client_name:
-                return False, "Please provide your name"
-            return True, ""
-        
-        elif stage == IntakeStage.DOCUMENT_UPLOAD:
-            # This stage is optional - always valid
-            return True, ""
-        
-        elif stage == IntakeStage.PROJECT_OVERVIEW:
-            if not profile.project_name:
-                return False, "Please provide a project name"
-            if not profile.project_description:
-                return False, "Please provide a project description"
-            return True, ""
-        
-        return True, ""
+        # Stages without a validator (e.g. the optional document upload) are always valid
+        validator = _STAGE_VALIDATORS.get(stage)
+        return validator(profile) if validator else (True, "")
     
     @staticmethod
     def next_stage(current: IntakeStage) -> Optional[IntakeStage]:
         """Get next stage in workflow."""
-        stages = list(IntakeStage)
-        try:
-            current_idx = stages.index(current)
-            if current_idx < len(stages) - 1:
-                return stages[current_idx + 1]
-        except (ValueError, IndexError):
-            pass
-        return None
+        return _NEXT_STAGE.get(current)
     
     @staticmethod
     def get_engagement_manager_greeting(profile: ClientProfile, has_documents: bool) -> str:
@@ -6,7 +6,16 @@ This module provides a clean Streamlit UI that integrates with the main consulti
 
 import streamlit as st
 import os
+import io
 import json
+import queue
+import threading
+import zipfile
+import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -23,6 +32,129 @@ from consulting_personas import get_persona_prompt
 from consultation_state import extract_structured_from_chat, ConsultationData
 
 
+# Discovery sections tracked by the QA controller, in display order
+_DISCOVERY_SECTIONS = (
+    'Features', 'Functional Requirements', 'Non-Functional Requirements',
+    'Expectations', 'Acceptance Criteria', 'Constraints',
+    'Deliverables', 'User Stories',
+)
+_DISCOVERY_SECTIONS_PROMPT = "; ".join(_DISCOVERY_SECTIONS)
+_DISCOVERY_SECTIONS_LOWER = tuple(s.lower() for s in _DISCOVERY_SECTIONS)
+
+# Directory the conductor writes deliverables into
+_OUTPUTS_DIR = "outputs"
+
+# File types accepted by the supporting-documents uploader
+_UPLOAD_TYPES = ('md', 'txt', 'pdf', 'docx')
+_UPLOAD_SUFFIXES = frozenset(f".{t}" for t in _UPLOAD_TYPES)
+# Upper bound on concurrent upload writes
+_SAVE_WORKERS = 8
+# Number of most recent progress messages kept on screen
+_LOG_WINDOW = 20
+# How often (seconds) the page polls a running background generation
+_GENERATION_POLL_INTERVAL = 0.5
+# Recent chat turns fed to the QA controller / engagement manager prompts
+_QA_CHAT_WINDOW = 12
+_EM_CHAT_WINDOW = 6
+# Bounds on the process-wide artifact caches (each generation run adds new mtime keys)
+_ARTIFACT_CACHE_ENTRIES = 32
+_BUNDLE_CACHE_ENTRIES = 8
+
+
+@st.cache_data(max_entries=_ARTIFACT_CACHE_ENTRIES, show_spinner=False)
+def _load_artifact_text(path_str: str, mtime_ns: int) -> str:
+    """Read a generated artifact once; mtime_ns is part of the cache key so rewrites are picked up."""
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+@st.cache_resource(max_entries=4)
+def _get_model_client(provider: Optional[str], model_name: Optional[str]) -> ModelClient:
+    """Shared ModelClient per (provider, model name), reused across reruns and sessions."""
+    client = ModelClient(provider)
+    if model_name:
+        client.model = model_name
+    return client
+
+
+class _FallbackReply(Exception):
+    """Carries a mock fallback reply out of _cached_generate so it is not cached."""
+
+    def __init__(self, reply: str):
+        super().__init__(reply)
+        self.reply = reply
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_generate(_model: ModelClient, provider: str, model_name: str, role: str, prompt: str, system: str) -> str:
+    """Memoize model replies per (provider, model, role, prompt, system).
+
+    `_model` is excluded from the cache key (leading underscore), so a repeated
+    prompt returns the stored reply without another LLM round trip. ModelClient
+    answers provider failures with its mock reply; that is raised instead of
+    returned so an outage is never cached (st.cache_data skips raising calls).
+    """
+    reply = _model.generate(role, prompt, system=system)
+    if provider != "mock" and reply == _model._mock(role, prompt):
+        raise _FallbackReply(reply)
+    return reply
+
+
+def _generate_reply(model: ModelClient, role: str, prompt: str, system: str) -> str:
+    """Model reply through the cache; uncached fallback replies are passed through."""
+    try:
+        return _cached_generate(model, model.provider, model.model, role, prompt, system)
+    except _FallbackReply as fallback:
+        return fallback.reply
+
+
+@st.cache_data(max_entries=_BUNDLE_CACHE_ENTRIES, show_spinner=False)
+def _build_outputs_bundle(files: tuple) -> bytes:
+    """Zip (path, mtime_ns) artifacts into one archive; the mtimes key the cache so it is rebuilt only on change.
+
+    Entries are stored uncompressed: PDF/DOCX/PNG outputs are already compressed.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for path_str, _mtime_ns in files:
+            zf.write(path_str, arcname=os.path.basename(path_str))
+    return buf.getvalue()
+
+
+def _run_conductor_job(project_path: str, outputs_path: str, log_queue: queue.Queue, result: dict):
+    """Background-thread body: run the conductor, streaming log messages into log_queue.
+
+    Runs outside the Streamlit script context, so it must not call st.*; the
+    outcome is left in `result` for the script to collect.
+    """
+    try:
+        result['artifacts'], result['validation_report'] = run_conductor(
+            project_path,
+            outputs_path,
+            max_rounds=3,
+            do_export=True,
+            log_callback=log_queue.put
+        )
+    except Exception as e:
+        result['error'] = e
+
+
+def _format_chat_line(message: dict) -> str:
+    """Render a chat message as a 'Client: ...' / 'Consultant: ...' prompt line."""
+    speaker = "Client" if message['role'] == 'user' else "Consultant"
+    return f"{speaker}: {message['content']}"
+
+
+def _format_profile_markdown(profile: ClientProfile) -> str:
+    """Render the project overview as one markdown block (one widget per rerun)."""
+    return "\n\n".join([
+        f"**Client:** {profile.client_name}",
+        f"**Organization:** {profile.organization}",
+        f"**Project:** {profile.project_name}",
+        f"**Industry:** {profile.industry}",
+        f"**Description:** {profile.project_description}",
+    ])
+
+
 class ProfessionalConsultingUI:
     """Professional consulting system UI with proper flow management."""
     
@@ -52,11 +184,8 @@ class ProfessionalConsultingUI:
         if 'discovery_status' not in st.session_state:
             st.session_state.discovery_status = {
                 'complete': False,
-                'missing_sections': [
-                    'Features', 'Functional Requirements', 'Non-Functional Requirements',
-                    'Expectations', 'Acceptance Criteria', 'Constraints',
-                    'Deliverables', 'User Stories'
-                ],
+                'missing_sections': list(_DISCOVERY_SECTIONS),
+                'missing_parsed': True,
                 'notes': ''
             }
         if 'auto_generate' not in st.session_state:
@@ -103,9 +232,16 @@ class ProfessionalConsultingUI:
             if ds['complete']:
                 st.success("✅ Discovery Complete (scope locked)")
             else:
-                st.info("Discovery In Progress")
-                if ds.get('missing_sections'):
-                    st.caption("Missing: " + ", ".join(ds['missing_sections'][:6]))
+                missing = ds.get('missing_sections') or []
+                if ds.get('missing_parsed', True):
+                    # Only count QA entries that name a known section
+                    missing_lower = {m.lower() for m in missing}
+                    covered = sum(1 for s in _DISCOVERY_SECTIONS_LOWER if s not in missing_lower)
+                    st.info(f"Discovery In Progress ({covered}/{len(_DISCOVERY_SECTIONS)} sections)")
+                else:
+                    st.info("Discovery In Progress")
+                if missing:
+                    st.caption("Missing: " + ", ".join(missing[:6]))
             st.toggle("Auto-generate when complete", key='auto_generate', value=st.session_state.auto_generate)
     
     def _render_intake_flow(self):
@@ -180,9 +316,12 @@ class ProfessionalConsultingUI:
                     # Set environment variables for model configuration
                     os.environ['MODEL_PROVIDER'] = llm_provider
                     os.environ['MODEL_NAME'] = model_name
+                    st.session_state.llm_provider = llm_provider
+                    st.session_state.llm_model = model_name
                     
                     # Store in session state
                     st.session_state.client_profile = client_profile
+                    st.session_state.profile_markdown = _format_profile_markdown(client_profile)
                     st.session_state.engagement_started = True
                     
                     st.success("✅ Professional consulting engagement started successfully!")
@@ -191,6 +330,181 @@ class ProfessionalConsultingUI:
                 except Exception as e:
                     st.error(f"❌ Failed to initialize system: {str(e)}")
     
+    def _refresh_outputs_cache(self) -> list:
+        """Scan the outputs directory once and keep (path, suffix, size, mtime_ns) tuples in session state.
+
+        Reruns reuse the cached listing; it is dropped after each generation and on New Session.
+        """
+        entries = []
+        try:
+            with os.scandir(_OUTPUTS_DIR) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        suffix = os.path.splitext(entry.name)[1].lower()
+                        entries.append((entry.path, suffix, stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            pass
+        entries.sort()
+        st.session_state.outputs_cache = entries
+        return entries
+
+    def _save_uploaded_files(self, uploaded, docs_dir: Path) -> list:
+        """Write each uploaded file into docs_dir and return the saved paths.
+
+        The upload's in-memory buffer is handed straight to os.write, so no
+        intermediate bytes copy is made. Multiple files are written concurrently
+        (file I/O releases the GIL); the returned paths keep the upload order.
+        """
+        # The uploader's type filter is advisory; only persist accepted suffixes.
+        # Same-name uploads share a target path, so keep only the last one per
+        # name (as the old sequential loop ended up with) rather than letting
+        # two workers write the same file concurrently.
+        uploaded = list({
+            uf.name: uf for uf in uploaded if Path(uf.name).suffix.lower() in _UPLOAD_SUFFIXES
+        }.values())
+        if not uploaded:
+            return []
+
+        def _save_one(uf) -> Path:
+            save_path = docs_dir / uf.name
+            mv = uf.getbuffer()
+            fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = 0
+                while written < len(mv):
+                    written += os.write(fd, mv[written:])
+            finally:
+                os.close(fd)
+            return save_path
+
+        if len(uploaded) == 1:
+            return [_save_one(uploaded[0])]
+        with ThreadPoolExecutor(max_workers=min(_SAVE_WORKERS, len(uploaded))) as pool:
+            return list(pool.map(_save_one, uploaded))
+
+    def _ensure_docs_dir(self) -> Path:
+        """Create project_documents/ once per session and return it."""
+        if not st.session_state.get('dirs_ready'):
+            docs_dir = Path(self.project_path) / "project_documents"
+            docs_dir.mkdir(parents=True, exist_ok=True)
+            st.session_state.docs_dir = str(docs_dir)
+            st.session_state.dirs_ready = True
+        return Path(st.session_state.docs_dir)
+
+    def _start_generation(self, client_profile: ClientProfile):
+        """Write consultation notes and start the conductor on a background thread."""
+        project_path = Path(self.project_path)
+        docs_dir = self._ensure_docs_dir()
+        self._write_consultation_notes(docs_dir, client_profile)
+
+        log_queue = queue.Queue()
+        result = {}
+        thread = threading.Thread(
+            target=_run_conductor_job,
+            args=(str(project_path), _OUTPUTS_DIR, log_queue, result),
+            daemon=True
+        )
+        thread.start()
+        st.session_state.generation_job = {
+            'thread': thread,
+            'queue': log_queue,
+            'result': result,
+            'log': deque(maxlen=_LOG_WINDOW),
+        }
+
+    def _render_generation_progress(self) -> bool:
+        """Drain the job's log queue and render progress; return True while the job is still running."""
+        job = st.session_state.generation_job
+        # Check liveness before draining so no message logged before exit is missed
+        running = job['thread'].is_alive()
+        log_queue, log_lines = job['queue'], job['log']
+        while True:
+            try:
+                log_lines.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if running:
+            st.info("⏳ Generating professional deliverables...")
+            st.markdown("\n\n".join(f"📋 {line}" for line in log_lines))
+            return True
+
+        del st.session_state.generation_job
+        error = job['result'].get('error')
+        if error is not None:
+            # Kept until the user retries, so auto-generate does not relaunch a failing run
+            st.session_state.generation_error = str(error)
+            st.error(f"❌ Error generating deliverables: {str(error)}")
+            st.error("Please check the console for detailed error information.")
+            return False
+
+        st.session_state.deliverables_generated = True
+        st.session_state.pop('outputs_cache', None)
+        st.rerun()
+
+    def _append_chat(self, role: str, content: str):
+        """Record a chat message and its formatted line in the rolling prompt window."""
+        st.session_state.chat_messages.append({"role": role, "content": content})
+        window = st.session_state.get('chat_window')
+        if window is None:
+            window = deque(
+                (_format_chat_line(m) for m in st.session_state.chat_messages[-_QA_CHAT_WINDOW:]),
+                maxlen=_QA_CHAT_WINDOW
+            )
+            st.session_state.chat_window = window
+        else:
+            window.append(_format_chat_line(st.session_state.chat_messages[-1]))
+
+    def _recent_chat(self, n: int) -> str:
+        """Join the last n formatted chat lines (n <= _QA_CHAT_WINDOW)."""
+        window = st.session_state.get('chat_window', ())
+        return "\n".join(islice(window, max(0, len(window) - n), None))
+
+    def _transcript_lines(self) -> list:
+        """Return formatted transcript lines, formatting only messages added since the last call."""
+        messages = st.session_state.chat_messages
+        lines = st.session_state.get('transcript_lines')
+        start_idx = st.session_state.get('notes_written_idx', 0)
+        if lines is None or start_idx > len(messages):
+            lines, start_idx = [], 0
+        lines.extend(
+            f"- **{'Client' if m.get('role') == 'user' else 'Consultant'}:** {m.get('content','').strip()}\n"
+            for m in messages[start_idx:]
+        )
+        st.session_state.transcript_lines = lines
+        st.session_state.notes_written_idx = len(messages)
+        return lines
+
+    def _write_consultation_notes(self, docs_dir: Path, client_profile: ClientProfile) -> Path:
+        """Write consultation_notes.md (profile, notes, summary, transcript) in one write."""
+        parts = [
+            "# Consultation Notes\n\n",
+            "## Client Information\n",
+            f"**Client:** {client_profile.client_name}\n",
+            f"**Organization:** {client_profile.organization}\n",
+            f"**Project:** {client_profile.project_name}\n",
+            f"**Industry:** {client_profile.industry}\n\n",
+            "## Project Description\n",
+            f"{client_profile.project_description}\n\n",
+            "## General Notes\n",
+            st.session_state.general_notes or "(none)\n",
+            "\n\n",
+        ]
+        structured_md = st.session_state.get('structured_md')
+        if structured_md:
+            parts += ["## Structured Consultation Summary\n", structured_md, "\n\n"]
+        parts.append("## Chat Transcript\n")
+        parts.extend(self._transcript_lines())
+        parts.append("\n")
+        if st.session_state.uploaded_files:
+            parts.append("## Uploaded Files\n")
+            parts.extend(f"- {p}\n" for p in st.session_state.uploaded_files)
+
+        consultation_file = docs_dir / "consultation_notes.md"
+        consultation_file.write_text("".join(parts), encoding='utf-8')
+        return consultation_file
+
     def _render_consulting_interface(self):
         """Render the main consulting interface."""
         if not st.session_state.client_profile:
@@ -198,6 +512,7 @@ class ProfessionalConsultingUI:
             return
         
         client_profile = st.session_state.client_profile
+        generating = False
         
         # Show client information
         st.header("Consulting Engagement")
@@ -206,104 +521,47 @@ class ProfessionalConsultingUI:
         
         with col1:
             st.subheader("Project Overview")
-            st.write(f"**Client:** {client_profile.client_name}")
-            st.write(f"**Organization:** {client_profile.organization}")
-            st.write(f"**Project:** {client_profile.project_name}")
-            st.write(f"**Industry:** {client_profile.industry}")
-            st.write(f"**Description:** {client_profile.project_description}")
+            if 'profile_markdown' not in st.session_state:
+                st.session_state.profile_markdown = _format_profile_markdown(client_profile)
+            st.markdown(st.session_state.profile_markdown)
         
         with col2:
             st.subheader("Actions")
             
             # Upload supporting documents (optional)
             st.caption("Optional: Upload any notes or reference documents")
-            uploaded = st.file_uploader("Upload documents", type=["md","txt","pdf","docx"], accept_multiple_files=True)
+            uploaded = st.file_uploader("Upload documents", type=_UPLOAD_TYPES, accept_multiple_files=True)
             if uploaded:
-                project_path = Path(self.project_path)
-                docs_dir = project_path / "project_documents"
-                project_path.mkdir(exist_ok=True)
-                docs_dir.mkdir(exist_ok=True)
-                for uf in uploaded:
-                    save_path = docs_dir / uf.name
-                    with open(save_path, 'wb') as f:
-                        f.write(uf.getbuffer())
-                    if str(save_path) not in st.session_state.uploaded_files:
-                        st.session_state.uploaded_files.append(str(save_path))
-                st.success(f"Uploaded {len(uploaded)} file(s)")
+                # The uploader keeps returning its files on every rerun (including the
+                # generation polling reruns); only write each upload once so files the
+                # background job is reading are never rewritten under it.
+                saved_ids = st.session_state.setdefault('saved_upload_ids', set())
+                new_files = [uf for uf in uploaded if uf.file_id not in saved_ids]
+                if new_files:
+                    saved = self._save_uploaded_files(new_files, self._ensure_docs_dir())
+                    saved_ids.update(uf.file_id for uf in new_files)
+                    for save_path in saved:
+                        if str(save_path) not in st.session_state.uploaded_files:
+                            st.session_state.uploaded_files.append(str(save_path))
+                    if saved:
+                        st.success(f"Uploaded {len(saved)} file(s)")
+                rejected = [uf.name for uf in uploaded if Path(uf.name).suffix.lower() not in _UPLOAD_SUFFIXES]
+                if rejected:
+                    st.warning("Skipped unsupported file type(s): " + ", ".join(rejected))
             
-            # Generate deliverables button
-            if not st.session_state.deliverables_generated:
+            # Generate deliverables button (generation runs on a background thread)
+            if 'generation_job' in st.session_state:
+                generating = self._render_generation_progress()
+            elif not st.session_state.deliverables_generated:
+                if 'generation_error' in st.session_state:
+                    st.error(f"❌ Last generation failed: {st.session_state.generation_error}")
                 if st.button("📄 Confirm & Generate Deliverables", type="primary"):
+                    st.session_state.pop('generation_error', None)
                     try:
-                        with st.spinner("Generating professional deliverables..."):
-                            # Create project documents directory
-                            project_path = Path(self.project_path)
-                            project_path.mkdir(exist_ok=True)
-                            docs_dir = project_path / "project_documents"
-                            docs_dir.mkdir(exist_ok=True)
-                            
-                            # Write consultation notes (includes chat transcript and notes)
-                            consultation_file = docs_dir / "consultation_notes.md"
-                            with open(consultation_file, 'w', encoding='utf-8') as f:
-                                f.write(f"# Consultation Notes\n\n")
-                                f.write(f"## Client Information\n")
-                                f.write(f"**Client:** {client_profile.client_name}\n")
-                                f.write(f"**Organization:** {client_profile.organization}\n")
-                                f.write(f"**Project:** {client_profile.project_name}\n")
-                                f.write(f"**Industry:** {client_profile.industry}\n\n")
-                                f.write(f"## Project Description\n")
-                                f.write(f"{client_profile.project_description}\n\n")
-                                f.write(f"## General Notes\n")
-                                f.write(st.session_state.general_notes or "(none)\n")
-                                f.write("\n\n")
-                                # Structured section
-                                if st.session_state.get('structured_md'):
-                                    f.write("## Structured Consultation Summary\n")
-                                    f.write(st.session_state.get('structured_md',''))
-                                    f.write("\n\n")
-                                f.write(f"## Chat Transcript\n")
-                                for m in st.session_state.chat_messages:
-                                    speaker = "Client" if m.get('role') == 'user' else "Consultant"
-                                    f.write(f"- **{speaker}:** {m.get('content','').strip()}\n")
-                                f.write("\n")
-                                if st.session_state.uploaded_files:
-                                    f.write("## Uploaded Files\n")
-                                    for p in st.session_state.uploaded_files:
-                                        f.write(f"- {p}\n")
-                            
-                            # Run the conductor
-                            artifacts, validation_report = run_conductor(
-                                str(project_path), 
-                                "outputs", 
-                                max_rounds=3, 
-                                do_export=True,
-                                log_callback=lambda msg: st.write(f"📋 {msg}")
-                            )
-                            
-                            st.session_state.deliverables_generated = True
-                            
-                            # Display results
-                            st.success("✅ Professional deliverables generated!")
-                            
-                            # Show generated files
-                            st.subheader("Generated Deliverables")
-                            for artifact_type, file_path in artifacts.items():
-                                if os.path.exists(file_path):
-                                    with st.expander(f"📋 {artifact_type.replace('_', ' ').title()}"):
-                                        with open(file_path, 'r', encoding='utf-8') as f:
-                                            content = f.read()
-                                        st.markdown(content)
-                            
-                            # Show validation report
-                            if os.path.exists(validation_report):
-                                with st.expander("📊 Validation Report"):
-                                    with open(validation_report, 'r', encoding='utf-8') as f:
-                                        validation_content = f.read()
-                                    st.markdown(validation_content)
-                            
-                            st.rerun()
-                            
+                        self._start_generation(client_profile)
+                        st.rerun()
                     except Exception as e:
+                        st.session_state.generation_error = str(e)
                         st.error(f"❌ Error generating deliverables: {str(e)}")
                         st.error("Please check the console for detailed error information.")
             else:
@@ -311,61 +569,37 @@ class ProfessionalConsultingUI:
                 
                 # Show generated files
                 st.subheader("Generated Deliverables")
-                outputs_dir = Path("outputs")
-                if outputs_dir.exists():
-                    for file_path in outputs_dir.glob("*.md"):
-                        with st.expander(f"📋 {file_path.stem.replace('_', ' ').title()}"):
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            st.markdown(content)
+                outputs_cache = st.session_state.get('outputs_cache')
+                if outputs_cache is None:
+                    outputs_cache = self._refresh_outputs_cache()
+                if outputs_cache:
+                    bundle_key = tuple((path_str, mtime_ns) for path_str, _suffix, _size, mtime_ns in outputs_cache)
+                    st.download_button(
+                        "📦 Download all (ZIP)",
+                        data=_build_outputs_bundle(bundle_key),
+                        file_name="deliverables.zip",
+                        mime="application/zip"
+                    )
+                for path_str, suffix, _size, mtime_ns in outputs_cache:
+                    if suffix != '.md':
+                        continue
+                    with st.expander(f"📋 {Path(path_str).stem.replace('_', ' ').title()}"):
+                        st.markdown(_load_artifact_text(path_str, mtime_ns))
 
         # Auto-generate when discovery is complete
         if (
             st.session_state.discovery_status.get('complete')
             and not st.session_state.deliverables_generated
             and st.session_state.auto_generate
+            and 'generation_job' not in st.session_state
+            and 'generation_error' not in st.session_state
         ):
             st.info("Discovery complete and scope locked. Generating deliverables...")
-            # Programmatically click the generate flow
             try:
-                with st.spinner("Generating professional deliverables..."):
-                    project_path = Path(self.project_path)
-                    project_path.mkdir(exist_ok=True)
-                    docs_dir = project_path / "project_documents"
-                    docs_dir.mkdir(exist_ok=True)
-                    consultation_file = docs_dir / "consultation_notes.md"
-                    with open(consultation_file, 'w', encoding='utf-8') as f:
-                        f.write(f"# Consultation Notes\n\n")
-                        f.write(f"## Client Information\n")
-                        f.write(f"**Client:** {client_profile.client_name}\n")
-                        f.write(f"**Organization:** {client_profile.organization}\n")
-                        f.write(f"**Project:** {client_profile.project_name}\n")
-                        f.write(f"**Industry:** {client_profile.industry}\n\n")
-                        f.write(f"## Project Description\n")
-                        f.write(f"{client_profile.project_description}\n\n")
-                        f.write(f"## General Notes\n")
-                        f.write(st.session_state.general_notes or "(none)\n")
-                        f.write("\n\n")
-                        f.write(f"## Chat Transcript\n")
-                        for m in st.session_state.chat_messages:
-                            speaker = "Client" if m.get('role') == 'user' else "Consultant"
-                            f.write(f"- **{speaker}:** {m.get('content','').strip()}\n")
-                        f.write("\n")
-                        if st.session_state.uploaded_files:
-                            f.write("## Uploaded Files\n")
-                            for p in st.session_state.uploaded_files:
-                                f.write(f"- {p}\n")
-                    artifacts, validation_report = run_conductor(
-                        str(project_path),
-                        "outputs",
-                        max_rounds=3,
-                        do_export=True,
-                        log_callback=lambda msg: st.write(f"📋 {msg}")
-                    )
-                    st.session_state.deliverables_generated = True
-                    st.success("✅ Professional deliverables generated!")
-                    st.rerun()
+                self._start_generation(client_profile)
+                st.rerun()
             except Exception as e:
+                st.session_state.generation_error = str(e)
                 st.error(f"❌ Error generating deliverables: {str(e)}")
         
         # Collaborative Discovery Chat & Notes
@@ -384,22 +618,19 @@ class ProfessionalConsultingUI:
             user_input = st.chat_input("Share details, requirements, constraints, or ask questions...")
             if user_input:
                 # Append user message
-                st.session_state.chat_messages.append({"role": "user", "content": user_input})
+                self._append_chat("user", user_input)
                 # Generate EM response using ModelClient
                 try:
-                    model = ModelClient()
+                    model = _get_model_client(st.session_state.get('llm_provider'), st.session_state.get('llm_model'))
                     persona = get_persona_prompt("engagement_manager")
                     # Build concise context from profile, notes, and last messages
-                    recent = "\n".join([
-                        ("Client: " + m['content']) if m['role'] == 'user' else ("Consultant: " + m['content'])
-                        for m in st.session_state.chat_messages[-6:]
-                    ])
+                    recent = self._recent_chat(_EM_CHAT_WINDOW)
                     context = f"Client: {client_profile.client_name}\nProject: {client_profile.project_name}\nIndustry: {client_profile.industry}\nDescription: {client_profile.project_description}\nNotes: {st.session_state.general_notes[:500]}\n\nRecent:\n{recent}"
                     prompt = f"Use the context to respond professionally and ask focused follow-ups.\n\n{context}\n\nUser said: {user_input}"
-                    reply = model.generate("engagement_manager", prompt, system=persona)
+                    reply = _generate_reply(model, "engagement_manager", prompt, persona)
                 except Exception as e:
                     reply = "Thanks—I've captured that. Could you also share key objectives, users, and constraints?"
-                st.session_state.chat_messages.append({"role": "assistant", "content": reply})
+                self._append_chat("assistant", reply)
 
                 # Meta QA controller: assess completeness and scope creep
                 try:
@@ -408,22 +639,18 @@ class ProfessionalConsultingUI:
                     qa_prompt = (
                         "You are the Meta QA Controller ensuring discovery completeness and scope control.\n"
                         "Given the context (profile, notes, recent chat), assess whether discovery is COMPLETE.\n"
-                        "If not complete, list MISSING_SECTIONS drawn from: Features; Functional Requirements; Non-Functional Requirements;"
-                        " Expectations; Acceptance Criteria; Constraints; Deliverables; User Stories.\n"
+                        f"If not complete, list MISSING_SECTIONS drawn from: {_DISCOVERY_SECTIONS_PROMPT}.\n"
                         "Also flag potential SCOPE_CREEP topics to defer.\n\n"
                         f"Context:\nClient: {client_profile.client_name}\nProject: {client_profile.project_name}\nIndustry: {client_profile.industry}\n"
                         f"Description: {client_profile.project_description}\nNotes: {st.session_state.general_notes[:1000]}\n\n"
-                        "Recent Chat:\n" + "\n".join([
-                            ("Client: " + m['content']) if m['role'] == 'user' else ("Consultant: " + m['content'])
-                            for m in st.session_state.chat_messages[-12:]
-                        ]) + "\n\n"
+                        "Recent Chat:\n" + self._recent_chat(_QA_CHAT_WINDOW) + "\n\n"
                         "Return this exact template:\n"
                         "COMPLETE: YES|NO\n"
                         "MISSING_SECTIONS: comma-separated list (or NONE)\n"
                         "SCOPE_CREEP: brief bullets (or NONE)\n"
                         "NEXT_QUESTION: one targeted question to progress toward completeness.\n"
                     )
-                    qa_output = model.generate("quality_assurance", qa_prompt, system=qa_persona)
+                    qa_output = _generate_reply(model, "quality_assurance", qa_prompt, qa_persona)
                     # Parse the simple template
                     complete = ('COMPLETE: YES' in qa_output.upper())
                     missing_line = ''
@@ -437,6 +664,8 @@ class ProfessionalConsultingUI:
                     st.session_state.discovery_status = {
                         'complete': complete,
                         'missing_sections': missing_sections,
+                        # False when the reply had no usable MISSING_SECTIONS line (e.g. mock provider)
+                        'missing_parsed': bool(missing_line),
                         'notes': qa_output
                     }
                     # If not complete, append QA next question as assistant prompt
@@ -446,18 +675,13 @@ class ProfessionalConsultingUI:
                             next_q = line.split(':', 1)[1].strip()
                             break
                     if not complete and next_q:
-                        st.session_state.chat_messages.append({"role": "assistant", "content": f"QA Check → {next_q}"})
+                        self._append_chat("assistant", f"QA Check → {next_q}")
                 except Exception:
                     pass
 
                 # Structured extraction: update normalized consultation data
                 try:
-                    profile_dict = {
-                        'client_name': client_profile.client_name,
-                        'project_name': client_profile.project_name,
-                        'industry': client_profile.industry,
-                        'project_description': client_profile.project_description,
-                    }
+                    profile_dict = asdict(client_profile)
                     structured: ConsultationData = extract_structured_from_chat(profile_dict, st.session_state.general_notes, st.session_state.chat_messages)
                     st.session_state['structured_md'] = structured.to_markdown()
                 except Exception:
@@ -480,7 +704,7 @@ class ProfessionalConsultingUI:
         with col1:
             if st.button("🔄 New Session"):
                 # Reset session state
-                for key in ['client_profile', 'engagement_started', 'discovery_complete', 'deliverables_generated', 'chat_messages', 'general_notes', 'uploaded_files']:
+                for key in ['client_profile', 'profile_markdown', 'llm_provider', 'llm_model', 'engagement_started', 'discovery_complete', 'deliverables_generated', 'generation_job', 'generation_error', 'outputs_cache', 'chat_messages', 'chat_window', 'transcript_lines', 'notes_written_idx', 'general_notes', 'uploaded_files', 'saved_upload_ids', 'dirs_ready', 'docs_dir']:
                     if key in st.session_state:
                         del st.session_state[key]
                 st.rerun()
@@ -488,12 +712,17 @@ class ProfessionalConsultingUI:
         with col2:
             if st.button("📊 System Info"):
                 st.json({
-                    "client_profile": st.session_state.client_profile.__dict__ if st.session_state.client_profile else None,
+                    "client_profile": asdict(st.session_state.client_profile) if st.session_state.client_profile else None,
                     "engagement_started": st.session_state.engagement_started,
                     "deliverables_generated": st.session_state.deliverables_generated,
                     "project_path": self.project_path
                 })
 
+        # Keep polling the background generation so its progress stays live
+        if generating:
+            time.sleep(_GENERATION_POLL_INTERVAL)
+            st.rerun()
+
 
 def main():
     """Main function to run the professional consulting system."""
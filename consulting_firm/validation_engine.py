@@ -1,6 +1,82 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+import heapq
 import os
 import re
+import time
+
+try:
+    # optional dependency; single-pass multi-keyword scan for industry standards
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except Exception:
+    _HAS_AHOCORASICK = False
+
+
+# Upper bound on concurrent artifact reads in Phase 1
+_READ_WORKERS = 8
+
+# Patterns compiled once at import and shared by every validate() call
+_RE_ARROW = re.compile(r"([A-Za-z0-9_ \-]+)\s*->\s*([A-Za-z0-9_ \-]+)")
+_RE_HEADING = re.compile(r'^#{1,6}\s+.+', re.MULTILINE)
+_RE_TIMELINE = re.compile(r"(phase|milestone).*?(\d+\s*(week|weeks|month|months))", re.I)
+_RE_CAMEL = re.compile(r'\b([A-Z][a-z]+(?:[A-Z][a-z]+)*)\b')
+# Matched against lowercased text; tech terms only anchor the start so
+# e.g. 'postgresql' still counts as 'postgres'
+_RE_JARGON = re.compile(r'\b(api|db|crud|orm|jwt|oauth|k8s|kubectl|dockerfile)\b')
+_RE_TECH = re.compile(r'\b(postgres|mysql|mongodb|redis|kafka|rabbitmq|aws|azure|gcp)')
+# Any measurable-success marker; plain substrings, as with the original 'in' checks
+_RE_METRICS = re.compile(r'kpi|metric|measure|target|percent|%')
+
+_SOW_REQUIRED_SECTIONS = (
+    'EXECUTIVE SUMMARY',
+    'SUCCESS CRITERIA',
+    'SCOPE & DELIVERABLES',
+    'TECHNICAL APPROACH',
+    'PROJECT MANAGEMENT',
+    'ASSUMPTIONS',
+)
+# Matched against uppercased SOW text
+_RE_SOW_SECTIONS = re.compile('|'.join(re.escape(s) for s in _SOW_REQUIRED_SECTIONS))
+
+_KNOWN_STANDARDS = (
+    'OWASP', 'ASVS', 'ISO 27001', 'SOC 2', 'SOC2', 'GDPR', 'HIPAA', 'PCI', 'PCI-DSS', 'NIST', 'CIS',
+)
+_KNOWN_STANDARDS_LOWER = tuple(s.lower() for s in _KNOWN_STANDARDS)
+if _HAS_AHOCORASICK:
+    _STANDARDS_AUTOMATON = ahocorasick.Automaton()
+    for _std, _std_lower in zip(_KNOWN_STANDARDS, _KNOWN_STANDARDS_LOWER):
+        _STANDARDS_AUTOMATON.add_word(_std_lower, _std)
+    _STANDARDS_AUTOMATON.make_automaton()
+    del _std, _std_lower
+
+
+def _count_headings(text: str) -> int:
+    """Count markdown headings, running the heading regex only where a line starts with '#'."""
+    count = 0
+    end = 0
+    m = _RE_HEADING.match(text)
+    if m:
+        count, end = 1, m.end()
+    pos = text.find('\n#', end)
+    while pos != -1:
+        m = _RE_HEADING.match(text, pos + 1)
+        if m:
+            # Resume after the match, as findall would (\s+ may span a newline)
+            count, end = count + 1, m.end()
+        else:
+            end = pos + 1
+        pos = text.find('\n#', end)
+    return count
+
+
+@lru_cache(maxsize=1)
+def _minute_prefix(minute: int) -> str:
+    """'YYYY-MM-DD HH:MM' for a minute since the epoch; shared by validations within that minute."""
+    return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
 
 
 class ValidationEngine:
@@ -18,55 +94,116 @@ class ValidationEngine:
 
     def __init__(self):
         self.validation_results = {}
+        # Report location is fixed, so create its directory once rather than per validate()
+        self._output_dir = 'outputs'
+        os.makedirs(self._output_dir, exist_ok=True)
+        self._report_path = os.path.join(self._output_dir, 'validation_report.md')
 
-    def _read(self, path: str) -> str:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
+    def _read_with_size(self, path: str) -> tuple | None:
+        """Return (text, size in bytes), or None if path is missing."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                # fstat on the open handle instead of separate exists/getsize lookups
+                size = os.fstat(f.fileno()).st_size
+                return f.read(), size
+        except FileNotFoundError:
+            return None
 
-    def _extract_components(self, txt: str) -> List[str]:
-        # Look for a Components list or lines like 'A -> B'
+    def _read_artifacts(self, paths: List[str]) -> list:
+        """Read all artifacts, overlapping the file I/O when there is more than one.
+
+        Results keep the order of paths.
+        """
+        if len(paths) <= 1:
+            return [self._read_with_size(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(paths))) as pool:
+            return list(pool.map(self._read_with_size, paths))
+
+    def _scan_tech(self, txt: str) -> tuple:
+        """Walk a tech document once, returning (components, arrows, heading_count).
+
+        Components come from bullet lines and arrow endpoints ('A -> B'). Headings
+        are counted with _count_headings so they follow the same rules as every
+        other document.
+        """
         comps = set()
-        # bullet list components
-        for m in re.findall(r"^-\s*(.+)$", txt, flags=re.MULTILINE):
-            if len(m.strip()) < 80:
-                comps.add(m.strip())
-        # arrow connections
-        for m in re.findall(r"([A-Za-z0-9_ \-]+)\s*->\s*([A-Za-z0-9_ \-]+)", txt):
-            comps.add(m[0].strip())
-            comps.add(m[1].strip())
-        return sorted(c for c in comps if c)
-
-    def _find_arrows(self, txt: str) -> List[tuple]:
-        return [(a.strip(), b.strip()) for a, b in re.findall(r"([A-Za-z0-9_ \-]+)\s*->\s*([A-Za-z0-9_ \-]+)", txt)]
+        arrows = []
+        for line in txt.splitlines():
+            if line.startswith('-'):
+                item = line[1:].strip()
+                if len(item) < 80:
+                    comps.add(item)
+            if '->' in line:
+                for a, b in self._find_arrows(line):
+                    comps.add(a)
+                    comps.add(b)
+                    arrows.append((a, b))
+        comps.discard('')
+        return comps, arrows, _count_headings(txt)
+
+    def _extract_components(self, txt: str) -> Set[str]:
+        # Look for a Components list or lines like 'A -> B'
+        return self._scan_tech(txt)[0]
+
+    def _find_arrows(self, txt: str) -> Iterator[tuple]:
+        # Lazily yield (source, target) pairs; callers iterate once
+        for m in _RE_ARROW.finditer(txt):
+            yield m.group(1).strip(), m.group(2).strip()
 
     def validate(self, artifacts: Dict[str, str]) -> str:
+        """Validate artifacts given as {name: file path}; returns the report path."""
+        loaded = self._read_artifacts(list(artifacts.values()))
+        return self._run_phases([
+            (name, path, result[0] if result else None, result[1] if result else None)
+            for (name, path), result in zip(artifacts.items(), loaded)
+        ])
+
+    def validate_texts(self, artifacts_text: Dict[str, str]) -> str:
+        """Validate artifacts already in memory, given as {name: text}; returns the report path.
+
+        Lets an in-process pipeline skip writing artifacts out only to read them back.
+        """
+        return self._run_phases([
+            (name, "(in memory)", txt, None) for name, txt in artifacts_text.items()
+        ])
+
+    def _run_phases(self, entries: List[tuple]) -> str:
+        """Run all validation phases and write the report.
+
+        entries are (name, source, text, size) tuples; text is None for a missing
+        artifact and size (bytes on disk) is None when the text did not come from a file.
+        """
         report_lines = ["# Validation Report\n"]
         report_lines.append(f"**Generated:** {self._get_timestamp()}\n")
         report_lines.append("---\n\n")
 
         # store small summaries for cross-checks
         summaries: Dict[str, str] = {}
+        # single-pass structure of the tech document, shared by Phases 1 and 4
+        tech_scan = None
         all_issues = []
         all_warnings = []
         all_passes = []
 
         # Phase 1: Individual artifact validation
         report_lines.append("## Phase 1: Individual Artifact Quality\n\n")
-        for name, path in artifacts.items():
-            report_lines.append(f"### {name.upper()}: `{path}`\n")
-            if not os.path.exists(path):
+        for name, source, txt, size in entries:
+            report_lines.append(f"### {name.upper()}: `{source}`\n")
+            if txt is None:
                 report_lines.append("- ❌ **Status:** MISSING\n")
                 all_issues.append(f"{name}: File missing")
                 continue
             
-            size = os.path.getsize(path)
-            report_lines.append(f"- ✅ **Status:** Present ({size:,} bytes)\n")
-
-            txt = self._read(path)
+            if size is not None:
+                report_lines.append(f"- ✅ **Status:** Present ({size:,} bytes)\n")
             summaries[name] = txt
 
             # Quality checks
-            quality_result = self._assess_document_quality(txt, name)
+            heading_count = None
+            if name == 'tech':
+                tech_scan = self._scan_tech(txt)
+                heading_count = tech_scan[2]
+            quality_result = self._assess_document_quality(txt, name, heading_count)
             if quality_result['issues']:
                 for issue in quality_result['issues']:
                     report_lines.append(f"- ❌ {issue}\n")
@@ -85,10 +222,9 @@ class ValidationEngine:
         # Phase 2: Professional standards validation
         report_lines.append("## Phase 2: Professional Deliverable Standards\n\n")
         
-        # SOW completeness check
-        sow_path = artifacts.get('sow')
-        if sow_path and os.path.exists(sow_path):
-            sow_text = summaries.get('sow', self._read(sow_path))
+        # SOW completeness check (summaries holds exactly the artifacts loaded in Phase 1)
+        if 'sow' in summaries:
+            sow_text = summaries['sow']
             sow_result = self.evaluate_sow_professional_standards(sow_text)
             report_lines.append("### Scope of Work (SOW) Completeness\n")
             report_lines.append(f"- **Overall Completeness:** {'✅ PASS' if sow_result['complete'] else '❌ FAIL'}\n")
@@ -125,14 +261,13 @@ class ValidationEngine:
         report_lines.append("\n")
 
         # Phase 4: Technical architecture validation
-        tech_path = artifacts.get('tech')
-        if tech_path and os.path.exists(tech_path):
+        if 'tech' in summaries:
             report_lines.append("## Phase 4: Technical Architecture Validation\n\n")
-            tech_txt = summaries.get('tech', '')
-            tech_results = self._validate_technical_architecture(tech_txt)
+            tech_txt = summaries['tech']
+            tech_results = self._validate_technical_architecture(tech_txt, tech_scan)
             
             if tech_results['components']:
-                report_lines.append(f"- ✅ **Components Identified:** {', '.join(tech_results['components'][:10])}")
+                report_lines.append(f"- ✅ **Components Identified:** {', '.join(tech_results['components_preview'])}")
                 if len(tech_results['components']) > 10:
                     report_lines.append(f" ... and {len(tech_results['components']) - 10} more")
                 report_lines.append("\n")
@@ -185,17 +320,21 @@ class ValidationEngine:
             report_lines.append("**❌ VALIDATION FAILED** - Significant issues detected. Major revisions required.\n")
 
         # Write report
-        out = os.path.join('outputs', 'validation_report.md')
-        os.makedirs(os.path.dirname(out), exist_ok=True)
+        out = self._report_path
+        # Stream the lines out with the same '\n' separators a join would add,
+        # without building the whole report as one string first
+        lines = iter(report_lines)
         with open(out, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
+            f.write(next(lines))
+            f.writelines('\n' + line for line in lines)
 
         return out
     
-    def _get_timestamp(self) -> str:
+    @staticmethod
+    def _get_timestamp() -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = time.time()
+        return f"{_minute_prefix(int(now // 60))}:{int(now % 60):02d}"
 
     # --- SOW evaluation helpers ---
     def evaluate_sow(self, text: str):
@@ -205,59 +344,49 @@ class ValidationEngine:
     
     def evaluate_sow_professional_standards(self, text: str) -> dict:
         """Comprehensive SOW validation against professional standards."""
-        required = [
-            'EXECUTIVE SUMMARY',
-            'SUCCESS CRITERIA',
-            'SCOPE & DELIVERABLES',
-            'TECHNICAL APPROACH',
-            'PROJECT MANAGEMENT',
-            'ASSUMPTIONS',
-        ]
-        # Optional but recommended
-        recommended = ['OUT-OF-SCOPE', 'RISKS', 'KPI', 'SUCCESS METRICS', 'ACCEPTANCE CRITERIA']
-        
         issues = []
         warnings = []
         passes = []
         
         # Check required sections
         text_upper = text.upper()
-        present = [s for s in required if s in text_upper]
-        missing = [s for s in required if s not in present]
+        text_lower = text.lower()
+        present = set(_RE_SOW_SECTIONS.findall(text_upper))
+        missing = [s for s in _SOW_REQUIRED_SECTIONS if s not in present]
         
         if not missing:
             passes.append("All required sections present")
         
         # Check acceptance criteria
-        has_acceptance = any('acceptance criteria' in line.lower() for line in text.splitlines())
+        has_acceptance = 'acceptance criteria' in text_lower
         if not has_acceptance:
             issues.append('Acceptance criteria section missing or not clearly labeled')
         else:
             passes.append("Acceptance criteria section present")
         
         # Check timeline heuristic
-        has_timeline = 'timeline' in text.lower() or 'milestone' in text.lower()
+        has_timeline = 'timeline' in text_lower or 'milestone' in text_lower
         if not has_timeline:
             warnings.append('Timeline or milestones not explicitly mentioned')
         else:
             passes.append("Timeline and milestones addressed")
         
         # Check for measurable success criteria
-        has_metrics = any(term in text.lower() for term in ['kpi', 'metric', 'measure', 'target', '%', 'percent'])
+        has_metrics = _RE_METRICS.search(text_lower) is not None
         if not has_metrics:
             warnings.append('Success criteria may not be measurable (no metrics/KPIs found)')
         else:
             passes.append("Measurable success criteria included")
         
         # Check for out-of-scope
-        has_out_of_scope = 'out-of-scope' in text.lower() or 'out of scope' in text.lower()
+        has_out_of_scope = 'out-of-scope' in text_lower or 'out of scope' in text_lower
         if not has_out_of_scope:
             warnings.append('Out-of-scope items not explicitly listed (recommended for clarity)')
         else:
             passes.append("Out-of-scope items explicitly defined")
         
         # Check for risk management
-        has_risks = 'risk' in text.lower()
+        has_risks = 'risk' in text_lower
         if not has_risks:
             warnings.append('Risk management not explicitly addressed')
         else:
@@ -281,11 +410,15 @@ class ValidationEngine:
             'passes': passes
         }
     
-    def _assess_document_quality(self, text: str, doc_name: str) -> dict:
-        """Assess individual document quality."""
+    def _assess_document_quality(self, text: str, doc_name: str, heading_count: int | None = None) -> dict:
+        """Assess individual document quality.
+
+        heading_count may be supplied when the caller has already scanned the document.
+        """
         issues = []
         warnings = []
         passes = []
+        text_lower = text.lower()
         
         # Length check
         if len(text.strip()) < 100:
@@ -296,7 +429,8 @@ class ValidationEngine:
             passes.append(f"Adequate length ({len(text):,} characters)")
         
         # Structure check (headings)
-        heading_count = len(re.findall(r'^#{1,6}\s+.+', text, re.MULTILINE))
+        if heading_count is None:
+            heading_count = _count_headings(text)
         if heading_count == 0:
             warnings.append("No markdown headings found - document may lack structure")
         elif heading_count < 3:
@@ -306,8 +440,7 @@ class ValidationEngine:
         
         # Jargon check for client-facing documents
         if doc_name in ['sow', 'discovery']:
-            jargon_terms = ['api', 'db', 'crud', 'orm', 'jwt', 'oauth', 'k8s', 'kubectl', 'dockerfile']
-            found = [t for t in jargon_terms if t in text.lower()]
+            found = set(_RE_JARGON.findall(text_lower))
             if len(found) > 5:
                 warnings.append(f"High technical jargon count ({len(found)} terms) - consider simplifying for client audience")
             elif len(found) > 0:
@@ -316,7 +449,7 @@ class ValidationEngine:
                 passes.append("Client-friendly language (minimal jargon)")
         
         # Completeness markers
-        has_todos = 'todo' in text.lower() or 'tbd' in text.lower() or 'xxx' in text.lower()
+        has_todos = 'todo' in text_lower or 'tbd' in text_lower or 'xxx' in text_lower
         if has_todos:
             issues.append("Document contains TODO/TBD placeholders - needs completion")
         else:
@@ -337,7 +470,7 @@ class ValidationEngine:
         # Timeline consistency
         timelines = {}
         for name, txt in summaries.items():
-            m = re.search(r"(phase|milestone).*?(\d+\s*(week|weeks|month|months))", txt, flags=re.I)
+            m = _RE_TIMELINE.search(txt)
             if m:
                 timelines[name] = m.group(2)
         
@@ -348,9 +481,8 @@ class ValidationEngine:
         
         # Tech stack consistency
         tech_mentions = {}
-        tech_terms = ['postgres', 'mysql', 'mongodb', 'redis', 'kafka', 'rabbitmq', 'aws', 'azure', 'gcp']
         for name, txt in summaries.items():
-            found = [t for t in tech_terms if t in txt.lower()]
+            found = set(_RE_TECH.findall(txt.lower()))
             if found:
                 tech_mentions[name] = found
         
@@ -369,9 +501,15 @@ class ValidationEngine:
         
         # Scope consistency - check if SOW and technical architecture align
         if 'sow' in summaries and 'tech' in summaries:
-            sow_components = set(re.findall(r'\b([A-Z][a-z]+(?:[A-Z][a-z]+)*)\b', summaries['sow']))
-            tech_components = set(re.findall(r'\b([A-Z][a-z]+(?:[A-Z][a-z]+)*)\b', summaries['tech']))
-            overlap = len(sow_components & tech_components)
+            sow_components = set(_RE_CAMEL.findall(summaries['sow']))
+            # Only "more than 3" matters, so stop scanning the tech doc at the 4th shared term
+            shared = set()
+            for m in _RE_CAMEL.finditer(summaries['tech']):
+                if m.group(1) in sow_components:
+                    shared.add(m.group(1))
+                    if len(shared) > 3:
+                        break
+            overlap = len(shared)
             if overlap > 3:
                 passes.append("Good alignment between SOW and technical architecture")
             elif overlap > 0:
@@ -383,14 +521,16 @@ class ValidationEngine:
             'passes': passes
         }
     
-    def _validate_technical_architecture(self, tech_text: str) -> dict:
-        """Validate technical architecture document."""
+    def _validate_technical_architecture(self, tech_text: str, scan: tuple | None = None) -> dict:
+        """Validate technical architecture document.
+
+        scan is the (components, arrows, heading_count) result of _scan_tech, if already computed.
+        """
         issues = []
         warnings = []
         passes = []
         
-        components = self._extract_components(tech_text)
-        edges = self._find_arrows(tech_text)
+        components, edges, _ = scan or self._scan_tech(tech_text)
         
         # Component validation
         if not components:
@@ -406,18 +546,18 @@ class ValidationEngine:
         elif len(edges) > 0:
             passes.append(f"{len(edges)} component connections documented")
         
-        # Check for orphan connections
-        unknown_refs = []
-        for a, b in edges:
-            if a not in components or b not in components:
-                unknown_refs.append((a, b))
+        # Check for orphan connections (set membership; only the first three are reported)
+        unknown_refs = list(islice(
+            ((a, b) for a, b in edges if a not in components or b not in components), 3
+        ))
         if unknown_refs:
-            issues.append(f"Connections reference undefined components: {unknown_refs[:3]}")
+            issues.append(f"Connections reference undefined components: {unknown_refs}")
         elif edges:
             passes.append("All connections reference defined components")
         
         # Check for architecture diagrams or visual aids
-        has_diagram_markers = any(marker in tech_text.lower() for marker in ['```mermaid', '```dot', 'diagram', 'figure'])
+        tech_lower = tech_text.lower()
+        has_diagram_markers = any(marker in tech_lower for marker in ['```mermaid', '```dot', 'diagram', 'figure'])
         if has_diagram_markers:
             passes.append("Diagram or visual representation included")
         else:
@@ -425,6 +565,8 @@ class ValidationEngine:
         
         return {
             'components': components,
+            # Only the first 10 names are shown, so avoid sorting the whole set
+            'components_preview': heapq.nsmallest(10, components),
             'connections_count': len(edges),
             'issues': issues,
             'warnings': warnings,
@@ -432,13 +574,13 @@ class ValidationEngine:
         }
 
     def _check_industry_standards(self, text: str):
-        known = [
-            'OWASP', 'ASVS', 'ISO 27001', 'SOC 2', 'SOC2', 'GDPR', 'HIPAA', 'PCI', 'PCI-DSS', 'NIST', 'CIS',
-        ]
-        present = []
-        for k in known:
-            if k.lower() in text.lower():
-                present.append(k)
+        text_lower = text.lower()
+        if _HAS_AHOCORASICK:
+            present = {std for _, std in _STANDARDS_AUTOMATON.iter(text_lower)}
+        else:
+            present = [
+                std for std, low in zip(_KNOWN_STANDARDS, _KNOWN_STANDARDS_LOWER) if low in text_lower
+            ]
         # Recommend some that are commonly expected if none of that class is present
         recommendations = []
         if not any(s in present for s in ['OWASP', 'ASVS']):
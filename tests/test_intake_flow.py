@@ -0,0 +1,24 @@
+from consulting_firm.intake_flow import ClientProfile, IntakeStage, IntakeWorkflow
+
+
+def test_context_string_cached_until_field_changes():
+    profile = ClientProfile(client_name="Ada", project_name="Engine", project_description="Compute tables")
+    first = profile.to_context_string()
+    assert "Project: Engine" in first
+    assert profile.to_context_string() is first
+
+    profile.project_name = "Analytical Engine"
+    updated = profile.to_context_string()
+    assert "Project: Analytical Engine" in updated
+    assert updated is not first
+
+
+def test_stage_validation_and_progression():
+    profile = ClientProfile(client_name="Ada")
+    assert IntakeWorkflow.validate_stage_completion(IntakeStage.CLIENT_INFO, profile) == (True, "")
+    assert IntakeWorkflow.validate_stage_completion(IntakeStage.DOCUMENT_UPLOAD, profile) == (True, "")
+    ok, msg = IntakeWorkflow.validate_stage_completion(IntakeStage.PROJECT_OVERVIEW, profile)
+    assert not ok and "project name" in msg
+
+    assert IntakeWorkflow.next_stage(IntakeStage.WELCOME) == IntakeStage.CLIENT_INFO
+    assert IntakeWorkflow.next_stage(IntakeStage.ENGAGEMENT_CONFIRMED) is None
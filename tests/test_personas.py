@@ -0,0 +1,14 @@
+from consulting_firm.consulting_personas import ProjectDomain, detect_project_domain
+
+
+def test_detect_domain_keywords():
+    assert detect_project_domain("A SaaS platform for invoices") == ProjectDomain.SOFTWARE_DEVELOPMENT
+    assert detect_project_domain("Warehouse robot fleet") == ProjectDomain.ROBOTICS_IOT
+    assert detect_project_domain("Something else entirely") == ProjectDomain.GENERAL
+
+
+def test_detect_domain_priority_and_documents():
+    # Trading outranks software even when software keywords appear first
+    assert detect_project_domain("An API platform", "backtest engine for futures") == ProjectDomain.QUANTITATIVE_TRADING
+    # Robotics outranks software when both keywords appear
+    assert detect_project_domain("apiot") == ProjectDomain.ROBOTICS_IOT
@@ -20,3 +20,38 @@ def test_validate_basic_quality(tmp_path):
     txt = open(out, 'r', encoding='utf-8').read()
     assert 'TOO_SHORT' in txt
     assert 'connections' in txt.lower() or 'component' in txt.lower()
+
+
+def test_jargon_matches_whole_words_only():
+    ve = ValidationEngine()
+    result = ve._assess_document_quality('Rapid feedback from the sponsor.', 'sow')
+    assert 'Client-friendly language (minimal jargon)' in result['passes']
+    result = ve._assess_document_quality('Expose an API backed by a DB.', 'sow')
+    assert 'Moderate technical jargon (2 terms) - acceptable' in result['passes']
+
+
+def test_evaluate_sow_missing_sections():
+    ve = ValidationEngine()
+    text = "## Executive Summary\n## Success Criteria\n## Scope & Deliverables\n## Assumptions\n"
+    complete, missing, _ = ve.evaluate_sow(text)
+    assert not complete
+    assert missing == ['TECHNICAL APPROACH', 'PROJECT MANAGEMENT']
+
+
+def test_validate_texts_in_memory():
+    ve = ValidationEngine()
+    out = ve.validate_texts({
+        'tech': '# Technical Architecture\n## Components\n## Flows\n- Frontend\n- API\nFrontend -> API\n',
+    })
+    txt = open(out, 'r', encoding='utf-8').read()
+    assert '(in memory)' in txt
+    assert 'MISSING' not in txt
+    assert '**Connections Documented:** 1' in txt
+
+
+def test_tech_heading_count_matches_other_documents():
+    ve = ValidationEngine()
+    # '## ' followed by a line break still counts as a heading in the multiline pattern
+    txt = "## \nTitle\n# Overview\n- API\n"
+    assert ve._scan_tech(txt)[2] == 2
+    assert 'Only 2 heading(s) - consider adding more structure' in ve._assess_document_quality(txt, 'discovery')['warnings']